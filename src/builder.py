@@ -3,15 +3,19 @@
 
 """Module for interacting with qemu image builder."""
 
+import concurrent.futures
 import dataclasses
+import itertools
 import logging
-import multiprocessing
 import os
+import shlex
 
 # Ignore B404:blacklist since all subprocesses are run with predefined executables.
 # nosec: B603 is applied across subprocess.run calls since we are calling with predefined
 # inputs.
 import subprocess  # nosec
+import tempfile
+import time
 import typing
 from pathlib import Path
 
@@ -20,6 +24,7 @@ import yaml
 from charms.operator_libs_linux.v0 import apt
 from charms.operator_libs_linux.v1 import systemd
 
+import run_options
 import state
 from exceptions import (
     BuilderInitError,
@@ -30,6 +35,12 @@ from exceptions import (
     UpgradeApplicationError,
 )
 
+try:
+    # Prefer the LibYAML C bindings bundled with PyYAML wheels for faster serialization.
+    from yaml import CSafeDumper as YamlSafeDumper
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as YamlSafeDumper  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,16 +53,30 @@ APT_DEPENDENCIES = [
     "python3-dev",
     "gcc",
 ]
+JUJU_EXEC_BIN = "/usr/bin/juju-exec"
+PIPX_BIN = "/usr/bin/pipx"
+RUN_ONE_BIN = "/usr/bin/run-one"
+SUDO_BIN = "/usr/bin/sudo"
 CRON_PATH = Path("/etc/cron.d")
 CRON_BUILD_SCHEDULE_PATH = CRON_PATH / "build-runner-image"
 GITHUB_RUNNER_IMAGE_BUILDER_PATH = UBUNTU_HOME / ".local/bin/github-runner-image-builder"
+GITHUB_RUNNER_IMAGE_BUILDER_BIN = str(GITHUB_RUNNER_IMAGE_BUILDER_PATH)
 OPENSTACK_CLOUDS_YAML_PATH = UBUNTU_HOME / "clouds.yaml"
+# Touched by apt after every successful package index update.
+APT_UPDATE_STAMP_PATH = Path("/var/lib/apt/periodic/update-success-stamp")
+APT_CACHE_MAX_AGE = 60 * 60
+
+# This option is to be deprecated when the application only supports external build mode.
+EXTERNAL_BUILD_FLAGS = ("--experimental-external", "True")
+
+# The CPU count does not change during the unit lifetime.
+MAX_PARALLEL_WORKERS = max(1, state.get_num_build_cores())
 
 # Bandit thinks this is a hardcoded secret
 IMAGE_BUILDER_SECRET_PREFIX = "IMAGE_BUILDER_SECRET_"  # nosec: B105
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class ApplicationInitializationConfig:
     """Required application initialization configurations.
 
@@ -108,11 +133,15 @@ def _install_dependencies(channel: state.BuilderAppChannel) -> None:
     Raises:
         DependencyInstallError: If there was an error installing apt packages.
     """
+    missing_packages = [
+        package for package in APT_DEPENDENCIES if not _is_apt_package_installed(package)
+    ]
     try:
-        apt.add_package(APT_DEPENDENCIES, update_cache=True)
+        if missing_packages:
+            apt.add_package(missing_packages, update_cache=_apt_cache_is_stale())
         subprocess.run(  # nosec: B603
             [
-                "/usr/bin/pipx",
+                PIPX_BIN,
                 "install",
                 f"git+https://github.com/canonical/github-runner-image-builder@{channel.value}",
             ],
@@ -124,6 +153,34 @@ def _install_dependencies(channel: state.BuilderAppChannel) -> None:
         raise DependencyInstallError from exc
 
 
+def _is_apt_package_installed(package: str) -> bool:
+    """Check whether an apt package is installed.
+
+    Args:
+        package: The apt package name.
+
+    Returns:
+        True if the package is installed. False otherwise.
+    """
+    try:
+        apt.DebianPackage.from_installed_package(package)
+    except apt.PackageNotFoundError:
+        return False
+    return True
+
+
+def _apt_cache_is_stale() -> bool:
+    """Check whether the apt package index needs to be updated.
+
+    Returns:
+        True if the package index was never updated or is older than APT_CACHE_MAX_AGE.
+    """
+    try:
+        return time.time() - APT_UPDATE_STAMP_PATH.stat().st_mtime > APT_CACHE_MAX_AGE
+    except FileNotFoundError:
+        return True
+
+
 def _initialize_image_builder(
     cloud_name: str, image_arch: state.Arch, resource_prefix: str
 ) -> None:
@@ -141,21 +198,21 @@ def _initialize_image_builder(
         cloud_name=cloud_name, image_arch=image_arch, resource_prefix=resource_prefix
     )
     try:
-        subprocess.run(
+        # Only stderr is of interest. The builder logs its progress there, so it is kept in the
+        # debug log on success and logged as the error on failure.
+        result = subprocess.run(
             init_cmd,
             check=True,
             user=UBUNTU_USER,
             cwd=UBUNTU_HOME,
             timeout=10 * 60,
-            env=os.environ,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
         )  # nosec: B603
+        logger.debug("Builder initialization output: %s", result.stderr)
     except subprocess.CalledProcessError as exc:
-        logger.error(
-            "Failed to initialize builder, code: %s, out: %s, err: %s",
-            exc.returncode,
-            exc.stdout,
-            exc.stderr,
-        )
+        logger.error("Failed to initialize builder, code: %s, err: %s", exc.returncode, exc.stderr)
         raise ImageBuilderInitializeError from exc
     except subprocess.SubprocessError as exc:
         raise ImageBuilderInitializeError from exc
@@ -174,20 +231,17 @@ def _build_init_command(
     Returns:
         The GitHub runner application init command.
     """
-    cmd = [
-        "/usr/bin/sudo",
-        str(GITHUB_RUNNER_IMAGE_BUILDER_PATH),
+    return [
+        SUDO_BIN,
+        GITHUB_RUNNER_IMAGE_BUILDER_BIN,
         "init",
-        "--experimental-external",
-        "True",
+        *EXTERNAL_BUILD_FLAGS,
         "--cloud-name",
         cloud_name,
         "--arch",
         image_arch.value,
+        *(("--prefix", resource_prefix) if resource_prefix else ()),
     ]
-    if resource_prefix:
-        cmd.extend(["--prefix", resource_prefix])
-    return cmd
 
 
 def install_clouds_yaml(cloud_config: state.OpenstackCloudsConfig) -> None:
@@ -200,12 +254,37 @@ def install_clouds_yaml(cloud_config: state.OpenstackCloudsConfig) -> None:
     Args:
         cloud_config: The contents of clouds.yaml parsed as dict.
     """
-    cloud_config_dict = cloud_config.model_dump()
-    if not OPENSTACK_CLOUDS_YAML_PATH.exists():
-        OPENSTACK_CLOUDS_YAML_PATH.write_text(yaml.safe_dump(cloud_config_dict), encoding="utf-8")
+    cloud_config_yaml = yaml.dump(
+        cloud_config.model_dump(), Dumper=YamlSafeDumper, encoding="utf-8"
+    )
+    if (
+        OPENSTACK_CLOUDS_YAML_PATH.exists()
+        and OPENSTACK_CLOUDS_YAML_PATH.read_bytes() == cloud_config_yaml
+    ):
         return
-    if yaml.safe_load(OPENSTACK_CLOUDS_YAML_PATH.read_text(encoding="utf-8")) != cloud_config_dict:
-        OPENSTACK_CLOUDS_YAML_PATH.write_text(yaml.safe_dump(cloud_config_dict), encoding="utf-8")
+    _write_file_atomic(path=OPENSTACK_CLOUDS_YAML_PATH, contents=cloud_config_yaml)
+
+
+def _write_file_atomic(path: Path, contents: bytes, mode: int = 0o644) -> None:
+    """Write the file contents by replacing the file, never leaving a partially written file.
+
+    Args:
+        path: The path of the file to write.
+        contents: The file contents.
+        mode: The file permission bits.
+    """
+    # The leading dot keeps the temporary file out of cron's /etc/cron.d file name filter.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            os.fchmod(tmp_file.fileno(), mode)
+            tmp_file.write(contents)
+            tmp_file.flush()
+            os.fsync(tmp_file.fileno())
+        os.replace(tmp_name, path)
+    except OSError:
+        os.unlink(tmp_name)
+        raise
 
 
 def configure_cron(unit_name: str, interval: int) -> bool:
@@ -218,25 +297,24 @@ def configure_cron(unit_name: str, interval: int) -> bool:
     Returns:
         True if cron is reconfigured. False otherwise.
     """
-    commands = [
-        "/usr/bin/run-one",
-        "/usr/bin/bash",
-        "-c",
-        f'/usr/bin/juju-exec "{unit_name}" "JUJU_DISPATCH_PATH=run HOME={UBUNTU_HOME} ./dispatch"',
-    ]
-
-    builder_exec_command: str = " ".join(commands)
-    cron_text = f"0 */{interval} * * * {UBUNTU_USER} {builder_exec_command}\n"
+    # juju-exec only queues the dispatch behind the unit machine lock, run-one skips the tick
+    # instead if the previous build is still running. cron already runs the line through /bin/sh.
+    cron_contents = (
+        f"0 */{interval} * * * {UBUNTU_USER} {RUN_ONE_BIN} {JUJU_EXEC_BIN} "
+        f'"{unit_name}" "JUJU_DISPATCH_PATH=run HOME={UBUNTU_HOME} ./dispatch"\n'
+    ).encode("utf-8")
 
-    if not _should_configure_cron(cron_contents=cron_text):
+    if not _should_configure_cron(cron_contents=cron_contents):
         return False
 
-    CRON_BUILD_SCHEDULE_PATH.write_text(cron_text, encoding="utf-8")
-    systemd.service_restart("cron")
+    # cron picks up the schedule on its own, it must never see a partially written file.
+    _write_file_atomic(path=CRON_BUILD_SCHEDULE_PATH, contents=cron_contents)
+    # cron re-reads /etc/cron.d on reload, a restart is only needed if the reload fails.
+    systemd.service_reload("cron", restart_on_failure=True)
     return True
 
 
-def _should_configure_cron(cron_contents: str) -> bool:
+def _should_configure_cron(cron_contents: bytes) -> bool:
     """Determine whether changes to cron should be applied.
 
     Args:
@@ -245,13 +323,18 @@ def _should_configure_cron(cron_contents: str) -> bool:
     Returns:
         True if interval has changed. False otherwise.
     """
-    if not CRON_BUILD_SCHEDULE_PATH.exists():
+    try:
+        cron_file_size = CRON_BUILD_SCHEDULE_PATH.stat().st_size
+    except FileNotFoundError:
+        return True
+    # A differing file size already tells the contents apart without reading the file.
+    if cron_file_size != len(cron_contents):
         return True
 
-    return cron_contents != CRON_BUILD_SCHEDULE_PATH.read_text(encoding="utf-8")
+    return cron_contents != CRON_BUILD_SCHEDULE_PATH.read_bytes()
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class CloudImage:
     """The cloud ID to uploaded image ID pair.
 
@@ -272,7 +355,7 @@ class CloudImage:
     microk8s: str
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class ScriptConfig:
     """User custom script related configurations.
 
@@ -286,7 +369,30 @@ class ScriptConfig:
     script_secrets: dict[str, str]
 
 
-@dataclasses.dataclass
+def _format_image_name(
+    prefix: str, base: state.BaseImage, arch: state.Arch, juju: str, microk8s: str
+) -> str:
+    """Format the image name from the image configuration attributes.
+
+    Args:
+        prefix: The image name prefix.
+        base: The Ubuntu base OS image.
+        arch: The image architecture.
+        juju: The Juju snap channel installed on the image.
+        microk8s: The Microk8s snap channel installed on the image.
+
+    Returns:
+        The image name.
+    """
+    image_name = f"{prefix}-{base.value}-{arch.value}"
+    if juju:
+        image_name += f"-juju-{juju.replace('/', '-')}"
+    if microk8s:
+        image_name += f"-mk8s-{microk8s.replace('/', '-')}"
+    return image_name
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
 class ImageConfig:
     """Builder run image related configuration parameters.
 
@@ -316,15 +422,16 @@ class ImageConfig:
         Returns:
             The image name.
         """
-        image_name = f"{self.prefix}-{self.base.value}-{self.arch.value}"
-        if self.juju:
-            image_name += f"-juju-{self.juju.replace('/','-')}"
-        if self.microk8s:
-            image_name += f"-mk8s-{self.microk8s.replace('/', '-')}"
-        return image_name
+        return _format_image_name(
+            prefix=self.prefix,
+            base=self.base,
+            arch=self.arch,
+            juju=self.juju,
+            microk8s=self.microk8s,
+        )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class CloudConfig:
     """Builder run cloud related configuration parameters.
 
@@ -345,7 +452,7 @@ class CloudConfig:
     upload_clouds: typing.Iterable[str]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class ExternalServiceConfig:
     """Builder run external service dependencies.
 
@@ -358,7 +465,7 @@ class ExternalServiceConfig:
     proxy: str | None
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class RunConfig:
     """Builder run configuration parameters.
 
@@ -373,7 +480,7 @@ class RunConfig:
     external_service: ExternalServiceConfig
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class ConfigMatrix:
     """Configurable image parameters matrix.
 
@@ -392,7 +499,7 @@ class ConfigMatrix:
     microk8s_channels: set[str]
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class StaticImageConfig:
     """Static image configuration values.
 
@@ -410,7 +517,7 @@ class StaticImageConfig:
     runner_version: str | None
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class StaticConfigs:
     """Static configurations that are used to interact with the image repository.
 
@@ -425,7 +532,9 @@ class StaticConfigs:
     service_config: ExternalServiceConfig
 
 
-def run(config_matrix: ConfigMatrix, static_config: StaticConfigs) -> list[list[CloudImage]]:
+def run(
+    config_matrix: ConfigMatrix, static_config: StaticConfigs
+) -> tuple[tuple[CloudImage, ...], ...]:
     """Run a build immediately.
 
     Args:
@@ -439,13 +548,15 @@ def run(config_matrix: ConfigMatrix, static_config: StaticConfigs) -> list[list[
         The built image metadata.
     """
     build_configs = _parametrize_build(config_matrix=config_matrix, static_config=static_config)
-    try:
-        num_cores = multiprocessing.cpu_count() - 1
-        with multiprocessing.Pool(min(len(build_configs), num_cores)) as pool:
-            build_results = pool.map(_run, build_configs)
-    except multiprocessing.ProcessError as exc:
-        raise BuilderRunError("Failed to run parallel build") from exc
-    return build_results
+    if not build_configs:
+        return ()
+    if len(build_configs) == 1:
+        return (_run(build_configs[0]),)
+    # The builds are bound by the image builder subprocesses, threads avoid forking the charm.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(len(build_configs), MAX_PARALLEL_WORKERS)
+    ) as executor:
+        return tuple(executor.map(_run, build_configs))
 
 
 def _parametrize_build(
@@ -460,43 +571,40 @@ def _parametrize_build(
     Returns:
         Per image build configuration values.
     """
-    configs: list[RunConfig] = []
-    for base in config_matrix.bases:
-        for juju in config_matrix.juju_channels:
-            for microk8s in config_matrix.microk8s_channels:
-                configs.append(
-                    RunConfig(
-                        image=ImageConfig(
-                            arch=static_config.image_config.arch,
-                            base=base,
-                            juju=juju,
-                            microk8s=microk8s,
-                            prefix=static_config.cloud_config.resource_prefix,
-                            runner_version=static_config.image_config.runner_version,
-                            script_config=ScriptConfig(
-                                script_url=static_config.image_config.script_url,
-                                script_secrets=static_config.image_config.script_secrets,
-                            ),
-                        ),
-                        cloud=CloudConfig(
-                            build_cloud=static_config.cloud_config.build_cloud,
-                            build_flavor=static_config.cloud_config.build_flavor,
-                            build_network=static_config.cloud_config.build_network,
-                            resource_prefix=static_config.cloud_config.resource_prefix,
-                            num_revisions=static_config.cloud_config.num_revisions,
-                            upload_clouds=static_config.cloud_config.upload_clouds,
-                        ),
-                        external_service=ExternalServiceConfig(
-                            dockerhub_cache=static_config.service_config.dockerhub_cache,
-                            proxy=(
-                                static_config.service_config.proxy
-                                if static_config.service_config.proxy
-                                else None
-                            ),
-                        ),
-                    )
-                )
-    return tuple(configs)
+    script_config = ScriptConfig(
+        script_url=static_config.image_config.script_url,
+        script_secrets=static_config.image_config.script_secrets,
+    )
+    cloud_config = CloudConfig(
+        build_cloud=static_config.cloud_config.build_cloud,
+        build_flavor=static_config.cloud_config.build_flavor,
+        build_network=static_config.cloud_config.build_network,
+        resource_prefix=static_config.cloud_config.resource_prefix,
+        num_revisions=static_config.cloud_config.num_revisions,
+        upload_clouds=static_config.cloud_config.upload_clouds,
+    )
+    external_service_config = ExternalServiceConfig(
+        dockerhub_cache=static_config.service_config.dockerhub_cache,
+        proxy=(static_config.service_config.proxy if static_config.service_config.proxy else None),
+    )
+    return tuple(
+        RunConfig(
+            image=ImageConfig(
+                arch=static_config.image_config.arch,
+                base=base,
+                juju=juju,
+                microk8s=microk8s,
+                prefix=static_config.cloud_config.resource_prefix,
+                runner_version=static_config.image_config.runner_version,
+                script_config=script_config,
+            ),
+            cloud=cloud_config,
+            external_service=external_service_config,
+        )
+        for (base, juju, microk8s) in itertools.product(
+            config_matrix.bases, config_matrix.juju_channels, config_matrix.microk8s_channels
+        )
+    )
 
 
 @tenacity.retry(
@@ -504,7 +612,7 @@ def _parametrize_build(
     stop=tenacity.stop_after_attempt(5),
     reraise=True,
 )
-def _run(config: RunConfig) -> list[CloudImage]:
+def _run(config: RunConfig) -> tuple[CloudImage, ...]:
     """Run a single build process.
 
     Args:
@@ -521,14 +629,14 @@ def _run(config: RunConfig) -> list[CloudImage]:
             run_args=_RunArgs(
                 cloud_name=config.cloud.build_cloud, image_name=config.image.image_name
             ),
-            cloud_options=_CloudOptions(
+            cloud_options=run_options.CloudOptions(
                 flavor=config.cloud.build_flavor,
                 keep_revisions=config.cloud.num_revisions,
                 network=config.cloud.build_network,
                 prefix=config.cloud.resource_prefix,
                 upload_clouds=config.cloud.upload_clouds,
             ),
-            image_options=_ImageOptions(
+            image_options=run_options.ImageOptions(
                 arch=config.image.arch,
                 image_base=config.image.base,
                 juju=config.image.juju,
@@ -537,12 +645,13 @@ def _run(config: RunConfig) -> list[CloudImage]:
                 script_url=config.image.script_config.script_url,
                 script_secrets=config.image.script_config.script_secrets,
             ),
-            service_options=_ServiceOptions(
+            service_options=run_options.ServiceOptions(
                 dockerhub_cache=config.external_service.dockerhub_cache,
                 proxy=config.external_service.proxy,
             ),
         )
-        logger.info("Run build command: %s", run_command)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Run build command: %s", shlex.join(run_command))
         # The arg "user" exists but pylint disagrees.
         stdout = subprocess.check_output(  # pylint: disable=unexpected-keyword-arg # nosec:B603
             args=run_command,
@@ -555,7 +664,8 @@ def _run(config: RunConfig) -> list[CloudImage]:
             },
         )
         # The return value of the CLI is "Image build success:\n<comma-separated-image-ids>"
-        return list(
+        image_ids = stdout.rsplit(maxsplit=1)[-1].split(",")
+        return tuple(
             CloudImage(
                 arch=config.image.arch,
                 base=config.image.base,
@@ -564,9 +674,7 @@ def _run(config: RunConfig) -> list[CloudImage]:
                 juju=config.image.juju,
                 microk8s=config.image.microk8s,
             )
-            for (cloud_id, image_id) in zip(
-                config.cloud.upload_clouds, stdout.split()[-1].split(",")
-            )
+            for (cloud_id, image_id) in zip(config.cloud.upload_clouds, image_ids)
         )
     except subprocess.CalledProcessError as exc:
         logger.error(
@@ -597,7 +705,7 @@ def _transform_secrets(secrets: dict[str, str] | None) -> dict[str, str]:
     )
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class _RunArgs:
     """Builder application run arguments.
 
@@ -610,68 +718,11 @@ class _RunArgs:
     image_name: str
 
 
-@dataclasses.dataclass
-class _CloudOptions:
-    """Builder application run optional arguments related to OpenStack cloud.
-
-    Attributes:
-        flavor: The OpenStack flavor to launch the VM with.
-        keep_revisions: The number of image revisions to keep before deletion from the image \
-            repository.
-        network: The OpenStack network to launch the builder VMs in.
-        prefix: The OpenStack artefacts resource prefix.
-        upload_clouds: The name of clouds in clouds.yaml to upload the final images to.
-    """
-
-    flavor: str | None
-    keep_revisions: int | None
-    network: str | None
-    prefix: str | None
-    upload_clouds: typing.Iterable[str] | None
-
-
-@dataclasses.dataclass
-class _ImageOptions:
-    """Builder application run optional arguments related to image.
-
-    Attributes:
-        arch: The architecture of the final image build.
-        image_base: The Ubuntu OS base.
-        juju: The Juju snap channel, e.g. 3.1/stable.
-        microk8s: The Microk8s snap channel, e.g. 1.29-strict/stable.
-        runner_version: The GitHub runner version, e.g. 1.2.3.
-        script_url: The URL of the script to run at the end of cloud-init.
-        script_secrets: The script secrets to load as environment variables before executing the \
-            script.
-    """
-
-    arch: state.Arch | None
-    image_base: state.BaseImage | None
-    juju: str | None
-    microk8s: str | None
-    runner_version: str | None
-    script_url: str | None
-    script_secrets: dict[str, str]
-
-
-@dataclasses.dataclass
-class _ServiceOptions:
-    """Builder application run optional arguments related to external helper services.
-
-    Attributes:
-        dockerhub_cache: The DockerHub cache to use when initializing microk8s.
-        proxy: The proxy to use when building the image.
-    """
-
-    dockerhub_cache: str | None
-    proxy: str | None
-
-
 def _build_run_command(
     run_args: _RunArgs,
-    cloud_options: _CloudOptions,
-    image_options: _ImageOptions,
-    service_options: _ServiceOptions,
+    cloud_options: run_options.CloudOptions,
+    image_options: run_options.ImageOptions,
+    service_options: run_options.ServiceOptions,
 ) -> list[str]:
     """Build the application run command.
 
@@ -684,97 +735,24 @@ def _build_run_command(
     Returns:
         The application run command.
     """
-    cmd = [
-        "/usr/bin/run-one",
-        "/usr/bin/sudo",
+    return [
+        RUN_ONE_BIN,
+        SUDO_BIN,
         "--preserve-env",
-        str(GITHUB_RUNNER_IMAGE_BUILDER_PATH),
+        GITHUB_RUNNER_IMAGE_BUILDER_BIN,
         "run",
         run_args.cloud_name,
         run_args.image_name,
-        # This option is to be deprecated when the application only supports external build mode.
-        "--experimental-external",
-        "True",
+        *EXTERNAL_BUILD_FLAGS,
+        *run_options.build_cloud_options(cloud_options=cloud_options),
+        *run_options.build_image_options(image_options=image_options),
+        *run_options.build_service_options(service_options=service_options),
     ]
-    cmd.extend(_build_run_cloud_options(cloud_options=cloud_options))
-    cmd.extend(_build_run_image_options(image_options=image_options))
-    cmd.extend(_build_run_service_options(service_options=service_options))
-    return cmd
-
-
-def _build_run_cloud_options(cloud_options: _CloudOptions) -> list[str]:
-    """Build the application run command cloud options.
-
-    Args:
-        cloud_options: Optional arguments related to OpenStack cloud.
-
-    Returns:
-        The application run options related to OpenStack cloud.
-    """
-    cmd: list[str] = []
-    if cloud_options.flavor:
-        cmd.extend(["--flavor", cloud_options.flavor])
-    if cloud_options.keep_revisions:
-        cmd.extend(["--keep-revisions", str(cloud_options.keep_revisions)])
-    if cloud_options.network:
-        cmd.extend(["--network", cloud_options.network])
-    if cloud_options.prefix:
-        cmd.extend(["--prefix", cloud_options.prefix])
-    if cloud_options.upload_clouds:
-        cmd.extend(["--upload-clouds", ",".join(cloud_options.upload_clouds)])
-    return cmd
-
-
-def _build_run_image_options(image_options: _ImageOptions) -> list[str]:
-    """Build the application run command image options.
-
-    Args:
-        image_options: Optional arguments related to output image.
-
-    Returns:
-        The application run options related to output image.
-    """
-    cmd: list[str] = []
-    if image_options.arch:
-        cmd.extend(["--arch", image_options.arch.value])
-    if image_options.image_base:
-        cmd.extend(["--base-image", image_options.image_base.value])
-    if image_options.juju:
-        cmd.extend(["--juju", image_options.juju])
-    if image_options.microk8s:
-        cmd.extend(["--microk8s", image_options.microk8s])
-    if image_options.runner_version:
-        cmd.extend(["--runner-version", image_options.runner_version])
-    if image_options.script_url:
-        cmd.extend(["--script-url", image_options.script_url])
-    return cmd
-
-
-def _build_run_service_options(service_options: _ServiceOptions) -> list[str]:
-    """Build the application run command service options.
-
-    Args:
-        service_options: Optional arguments related to image building helper services.
-
-    Returns:
-        The application run options related to helper services.
-    """
-    cmd: list[str] = []
-    if service_options.dockerhub_cache:
-        cmd.extend(["--dockerhub-cache", service_options.dockerhub_cache])
-    if service_options.proxy:
-        cmd.extend(
-            [
-                "--proxy",
-                service_options.proxy.removeprefix("http://").removeprefix("https://"),
-            ]
-        )
-    return cmd
 
 
 def get_latest_images(
     config_matrix: ConfigMatrix, static_config: StaticConfigs
-) -> list[CloudImage]:
+) -> tuple[CloudImage, ...]:
     """Fetch the latest image build ID.
 
     Args:
@@ -788,16 +766,23 @@ def get_latest_images(
         The latest successful image build information.
     """
     fetch_configs = _parametrize_fetch(config_matrix=config_matrix, static_config=static_config)
-    try:
-        num_cores = multiprocessing.cpu_count() - 1
-        with multiprocessing.Pool(min(len(fetch_configs), num_cores)) as pool:
-            get_results = pool.map(_get_latest_image, fetch_configs)
-    except multiprocessing.ProcessError as exc:
-        raise GetLatestImageError("Failed to run parallel fetch") from exc
-    return get_results
+    # Identical fetch configurations resolve to the same image, query each of them only once.
+    unique_fetch_configs = tuple(dict.fromkeys(fetch_configs))
+    if not unique_fetch_configs:
+        return ()
+    if len(unique_fetch_configs) == 1:
+        latest_image = _get_latest_image(unique_fetch_configs[0])
+        return (latest_image,) * len(fetch_configs)
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(len(unique_fetch_configs), MAX_PARALLEL_WORKERS)
+    ) as executor:
+        latest_images = dict(
+            zip(unique_fetch_configs, executor.map(_get_latest_image, unique_fetch_configs))
+        )
+    return tuple(latest_images[config] for config in fetch_configs)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True, slots=True)
 class FetchConfig:
     """Fetch image configuration parameters.
 
@@ -825,12 +810,13 @@ class FetchConfig:
         Returns:
             The image name.
         """
-        image_name = f"{self.prefix}-{self.base.value}-{self.arch.value}"
-        if self.juju:
-            image_name += f"-juju-{self.juju.replace('/', '-')}"
-        if self.microk8s:
-            image_name += f"-mk8s-{self.microk8s.replace('/', '-')}"
-        return image_name
+        return _format_image_name(
+            prefix=self.prefix,
+            base=self.base,
+            arch=self.arch,
+            juju=self.juju,
+            microk8s=self.microk8s,
+        )
 
 
 def _parametrize_fetch(
@@ -845,21 +831,19 @@ def _parametrize_fetch(
     Returns:
         Per image fetch configuration values.
     """
-    configs = []
-    for base in config_matrix.bases:
-        for juju in config_matrix.juju_channels:
-            for microk8s in config_matrix.microk8s_channels:
-                configs.append(
-                    FetchConfig(
-                        arch=static_config.image_config.arch,
-                        base=base,
-                        cloud_id=static_config.cloud_config.build_cloud,
-                        prefix=static_config.cloud_config.resource_prefix,
-                        juju=juju,
-                        microk8s=microk8s,
-                    )
-                )
-    return tuple(configs)
+    return tuple(
+        FetchConfig(
+            arch=static_config.image_config.arch,
+            base=base,
+            cloud_id=static_config.cloud_config.build_cloud,
+            prefix=static_config.cloud_config.resource_prefix,
+            juju=juju,
+            microk8s=microk8s,
+        )
+        for (base, juju, microk8s) in itertools.product(
+            config_matrix.bases, config_matrix.juju_channels, config_matrix.microk8s_channels
+        )
+    )
 
 
 def _get_latest_image(config: FetchConfig) -> CloudImage:
@@ -878,9 +862,9 @@ def _get_latest_image(config: FetchConfig) -> CloudImage:
         # the user keyword argument exists but pylint doesn't think so.
         image_id = subprocess.check_output(  # pylint: disable=unexpected-keyword-arg
             [
-                "/usr/bin/sudo",
+                SUDO_BIN,
                 "--preserve-env",
-                str(GITHUB_RUNNER_IMAGE_BUILDER_PATH),
+                GITHUB_RUNNER_IMAGE_BUILDER_BIN,
                 "latest-build-id",
                 config.cloud_id,
                 config.image_name,
@@ -888,7 +872,6 @@ def _get_latest_image(config: FetchConfig) -> CloudImage:
             user=UBUNTU_USER,
             cwd=UBUNTU_HOME,
             timeout=10 * 60,
-            env=os.environ,
             encoding="utf-8",
         )  # nosec: B603
         return CloudImage(
@@ -920,8 +903,8 @@ def upgrade_app() -> None:
     try:
         subprocess.run(  # nosec: B603
             [
-                "/usr/bin/run-one",
-                "/usr/bin/pipx",
+                RUN_ONE_BIN,
+                PIPX_BIN,
                 "upgrade",
                 "github-runner-image-builder",
             ],
@@ -6,7 +6,7 @@
 import json
 import logging
 from collections import defaultdict
-from typing import TypedDict
+from typing import Sequence, TypedDict
 
 import ops
 
@@ -105,7 +105,7 @@ class Observer(ops.Object):
 
     def update_image_data(
         self,
-        cloud_images: list[list[builder.CloudImage]],
+        cloud_images: Sequence[Sequence[builder.CloudImage]],
     ) -> None:
         """Update relation data for each cloud coming from image requires side of relation.
 
@@ -134,7 +134,7 @@ class Observer(ops.Object):
 
 
 def _build_cloud_to_images_map(
-    cloud_images: list[list[builder.CloudImage]],
+    cloud_images: Sequence[Sequence[builder.CloudImage]],
 ) -> dict[str, list[builder.CloudImage]]:
     """Build a map of cloud id to cloud_images.
 
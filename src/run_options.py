@@ -0,0 +1,136 @@
+# Copyright 2025 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Module for building the image builder application run command options."""
+
+import dataclasses
+import typing
+
+import state
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class CloudOptions:
+    """Builder application run optional arguments related to OpenStack cloud.
+
+    Attributes:
+        flavor: The OpenStack flavor to launch the VM with.
+        keep_revisions: The number of image revisions to keep before deletion from the image \
+            repository.
+        network: The OpenStack network to launch the builder VMs in.
+        prefix: The OpenStack artefacts resource prefix.
+        upload_clouds: The name of clouds in clouds.yaml to upload the final images to.
+    """
+
+    flavor: str | None
+    keep_revisions: int | None
+    network: str | None
+    prefix: str | None
+    upload_clouds: typing.Iterable[str] | None
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ImageOptions:
+    """Builder application run optional arguments related to image.
+
+    Attributes:
+        arch: The architecture of the final image build.
+        image_base: The Ubuntu OS base.
+        juju: The Juju snap channel, e.g. 3.1/stable.
+        microk8s: The Microk8s snap channel, e.g. 1.29-strict/stable.
+        runner_version: The GitHub runner version, e.g. 1.2.3.
+        script_url: The URL of the script to run at the end of cloud-init.
+        script_secrets: The script secrets to load as environment variables before executing the \
+            script.
+    """
+
+    arch: state.Arch | None
+    image_base: state.BaseImage | None
+    juju: str | None
+    microk8s: str | None
+    runner_version: str | None
+    script_url: str | None
+    script_secrets: dict[str, str]
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class ServiceOptions:
+    """Builder application run optional arguments related to external helper services.
+
+    Attributes:
+        dockerhub_cache: The DockerHub cache to use when initializing microk8s.
+        proxy: The proxy to use when building the image.
+    """
+
+    dockerhub_cache: str | None
+    proxy: str | None
+
+
+def build_cloud_options(cloud_options: CloudOptions) -> list[str]:
+    """Build the application run command cloud options.
+
+    Args:
+        cloud_options: Optional arguments related to OpenStack cloud.
+
+    Returns:
+        The application run options related to OpenStack cloud.
+    """
+    cmd: list[str] = []
+    if cloud_options.flavor:
+        cmd.extend(["--flavor", cloud_options.flavor])
+    if cloud_options.keep_revisions:
+        cmd.extend(["--keep-revisions", str(cloud_options.keep_revisions)])
+    if cloud_options.network:
+        cmd.extend(["--network", cloud_options.network])
+    if cloud_options.prefix:
+        cmd.extend(["--prefix", cloud_options.prefix])
+    if cloud_options.upload_clouds:
+        cmd.extend(["--upload-clouds", ",".join(cloud_options.upload_clouds)])
+    return cmd
+
+
+def build_image_options(image_options: ImageOptions) -> list[str]:
+    """Build the application run command image options.
+
+    Args:
+        image_options: Optional arguments related to output image.
+
+    Returns:
+        The application run options related to output image.
+    """
+    cmd: list[str] = []
+    if image_options.arch:
+        cmd.extend(["--arch", image_options.arch.value])
+    if image_options.image_base:
+        cmd.extend(["--base-image", image_options.image_base.value])
+    if image_options.juju:
+        cmd.extend(["--juju", image_options.juju])
+    if image_options.microk8s:
+        cmd.extend(["--microk8s", image_options.microk8s])
+    if image_options.runner_version:
+        cmd.extend(["--runner-version", image_options.runner_version])
+    if image_options.script_url:
+        cmd.extend(["--script-url", image_options.script_url])
+    return cmd
+
+
+def build_service_options(service_options: ServiceOptions) -> list[str]:
+    """Build the application run command service options.
+
+    Args:
+        service_options: Optional arguments related to image building helper services.
+
+    Returns:
+        The application run options related to helper services.
+    """
+    cmd: list[str] = []
+    if service_options.dockerhub_cache:
+        cmd.extend(["--dockerhub-cache", service_options.dockerhub_cache])
+    if service_options.proxy:
+        cmd.extend(
+            [
+                "--proxy",
+                service_options.proxy.removeprefix("http://").removeprefix("https://"),
+            ]
+        )
+    return cmd
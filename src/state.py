@@ -5,7 +5,6 @@
 
 import dataclasses
 import logging
-import multiprocessing
 import os
 import platform
 import typing
@@ -609,6 +608,18 @@ class InsufficientCoresError(CharmConfigInvalidError):
     """Represents an error with invalid charm resource configuration."""
 
 
+def get_num_build_cores() -> int:
+    """Get the number of cores available for building images.
+
+    The affinity mask honours CPU limits applied to the unit, unlike the host CPU count. One core
+    is left for the charm itself.
+
+    Returns:
+        The number of cores available for building images, may be less than 1.
+    """
+    return len(os.sched_getaffinity(0)) - 1
+
+
 def _get_num_parallel_build(charm: ops.CharmBase) -> int:
     """Determine the number of parallel build that the charm can run.
 
@@ -621,7 +632,7 @@ def _get_num_parallel_build(charm: ops.CharmBase) -> int:
     Returns:
         The number of cores to use for parallel building of images.
     """
-    num_cores = multiprocessing.cpu_count() - 1
+    num_cores = get_num_build_cores()
     if num_cores < 1:
         raise InsufficientCoresError(
             "Please allocate more cores "
@@ -7,10 +7,14 @@
 # We are testing extensively with data structures, hence the many lines.
 # pylint:disable=protected-access, too-many-lines
 
+import dataclasses
+import logging
+import os
 import secrets
 
 # The subprocess module is imported for monkeypatching.
 import subprocess  # nosec: B404
+import time
 import typing
 from pathlib import Path
 from unittest.mock import MagicMock
@@ -20,6 +24,7 @@ import yaml
 from charms.operator_libs_linux.v0 import apt
 
 import builder
+import run_options
 import state
 from tests.unit import factories
 
@@ -78,6 +83,7 @@ def test__install_dependencies_fail(monkeypatch: pytest.MonkeyPatch):
     act: when _install_dependencies is called.
     assert: DependencyInstallError is raised.
     """
+    monkeypatch.setattr(builder, "_is_apt_package_installed", MagicMock(return_value=False))
     monkeypatch.setattr(apt, "add_package", MagicMock())
     monkeypatch.setattr(
         subprocess,
@@ -97,6 +103,7 @@ def test__install_dependencies(monkeypatch: pytest.MonkeyPatch):
     act: when _install_dependencies is called.
     assert: mocked functions are called.
     """
+    monkeypatch.setattr(builder, "_is_apt_package_installed", MagicMock(return_value=False))
     monkeypatch.setattr(apt, "add_package", (apt_mock := MagicMock()))
     monkeypatch.setattr(subprocess, "run", (run_mock := MagicMock()))
 
@@ -106,6 +113,70 @@ def test__install_dependencies(monkeypatch: pytest.MonkeyPatch):
     run_mock.assert_called_once()
 
 
+def test__install_dependencies_apt_packages_installed(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: given all apt dependencies already installed.
+    act: when _install_dependencies is called.
+    assert: apt packages are not added while the image builder is installed.
+    """
+    monkeypatch.setattr(builder, "_is_apt_package_installed", MagicMock(return_value=True))
+    monkeypatch.setattr(apt, "add_package", (apt_mock := MagicMock()))
+    monkeypatch.setattr(subprocess, "run", (run_mock := MagicMock()))
+
+    builder._install_dependencies(channel=MagicMock())
+
+    apt_mock.assert_not_called()
+    run_mock.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "from_installed_package, expected",
+    [
+        pytest.param(MagicMock(), True, id="installed"),
+        pytest.param(
+            MagicMock(side_effect=apt.PackageNotFoundError("Package is not installed")),
+            False,
+            id="not installed",
+        ),
+    ],
+)
+def test__is_apt_package_installed(
+    monkeypatch: pytest.MonkeyPatch, from_installed_package: MagicMock, expected: bool
+):
+    """
+    arrange: given a monkeypatched apt installed package lookup.
+    act: when _is_apt_package_installed is called.
+    assert: the package is reported installed only if the lookup succeeds.
+    """
+    monkeypatch.setattr(apt.DebianPackage, "from_installed_package", from_installed_package)
+
+    assert builder._is_apt_package_installed("pipx") == expected
+
+
+@pytest.mark.parametrize(
+    "stamp_age, expected",
+    [
+        pytest.param(None, True, id="never updated"),
+        pytest.param(builder.APT_CACHE_MAX_AGE + 60, True, id="stale"),
+        pytest.param(60, False, id="fresh"),
+    ],
+)
+def test__apt_cache_is_stale(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, stamp_age: int | None, expected: bool
+):
+    """
+    arrange: given an apt update stamp file of a given age or a missing stamp file.
+    act: when _apt_cache_is_stale is called.
+    assert: the package index is reported stale only when missing or older than the max age.
+    """
+    monkeypatch.setattr(builder, "APT_UPDATE_STAMP_PATH", (stamp_path := tmp_path / "stamp"))
+    if stamp_age is not None:
+        stamp_path.touch()
+        os.utime(stamp_path, (mtime := time.time() - stamp_age, mtime))
+
+    assert builder._apt_cache_is_stale() == expected
+
+
 @pytest.mark.parametrize(
     "error",
     [
@@ -137,6 +208,64 @@ def test__initialize_image_builder_error(
         )
 
 
+def test__initialize_image_builder_error_log(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
+    """
+    arrange: given monkeypatched subprocess.run function that fails with an error output.
+    act: when _initialize_image_builder is called.
+    assert: the captured error output is logged as an error.
+    """
+    monkeypatch.setattr(builder, "_build_init_command", MagicMock(return_value=[]))
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        MagicMock(side_effect=subprocess.CalledProcessError(1, [], None, "init failed")),
+    )
+
+    with pytest.raises(builder.ImageBuilderInitializeError):
+        builder._initialize_image_builder(
+            cloud_name=MagicMock(), image_arch=MagicMock(), resource_prefix=MagicMock()
+        )
+
+    assert [(record.levelno, record.getMessage()) for record in caplog.records] == [
+        (logging.ERROR, "Failed to initialize builder, code: 1, err: init failed")
+    ]
+
+
+def test__initialize_image_builder(
+    monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+):
+    """
+    arrange: given monkeypatched subprocess.run function that succeeds with a progress output.
+    act: when _initialize_image_builder is called.
+    assert: the init output is discarded while stderr is captured as text and logged at debug.
+    """
+    caplog.set_level(logging.DEBUG, logger=builder.logger.name)
+    monkeypatch.setattr(builder, "_build_init_command", MagicMock(return_value=[]))
+    monkeypatch.setattr(
+        subprocess,
+        "run",
+        (
+            run_mock := MagicMock(
+                return_value=subprocess.CompletedProcess([], 0, None, "init progress")
+            )
+        ),
+    )
+
+    builder._initialize_image_builder(
+        cloud_name=MagicMock(), image_arch=MagicMock(), resource_prefix=MagicMock()
+    )
+
+    run_mock.assert_called_once()
+    assert run_mock.call_args.kwargs["stdout"] == subprocess.DEVNULL
+    assert run_mock.call_args.kwargs["stderr"] == subprocess.PIPE
+    assert run_mock.call_args.kwargs["text"]
+    assert [(record.levelno, record.getMessage()) for record in caplog.records] == [
+        (logging.DEBUG, "Builder initialization output: init progress")
+    ]
+
+
 @pytest.mark.parametrize(
     "resource_prefix, expected_command",
     [
@@ -330,29 +459,62 @@ def test_install_clouds_yaml(
     assert contents == cloud_config.model_dump()
 
 
+def test__write_file_atomic(tmp_path: Path):
+    """
+    arrange: given an existing file.
+    act: when _write_file_atomic is called.
+    assert: the file contents are replaced and no temporary file is left behind.
+    """
+    test_path = tmp_path / "test"
+    test_path.write_text("original contents", encoding="utf-8")
+
+    builder._write_file_atomic(path=test_path, contents=b"new contents")
+
+    assert test_path.read_bytes() == b"new contents"
+    assert list(tmp_path.iterdir()) == [test_path]
+    assert test_path.stat().st_mode & 0o777 == 0o644
+
+
+def test__write_file_atomic_error(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    """
+    arrange: given an existing file and monkeypatched os.replace that raises an OSError.
+    act: when _write_file_atomic is called.
+    assert: the error is re-raised, the file is untouched and the temporary file is removed.
+    """
+    test_path = tmp_path / "test"
+    test_path.write_text("original contents", encoding="utf-8")
+    monkeypatch.setattr(builder.os, "replace", MagicMock(side_effect=OSError("disk full")))
+
+    with pytest.raises(OSError):
+        builder._write_file_atomic(path=test_path, contents=b"new contents")
+
+    assert test_path.read_text(encoding="utf-8") == "original contents"
+    assert list(tmp_path.iterdir()) == [test_path]
+
+
 def test_configure_cron_no_reconfigure(monkeypatch: pytest.MonkeyPatch):
     """
     arrange: given monkeypatched _should_configure_cron which returns False, denoting no change.
     act: when configure_cron is called.
-    assert: cron service is not restarted.
+    assert: cron service is not reloaded.
     """
     monkeypatch.setattr(builder, "_should_configure_cron", MagicMock(return_value=False))
-    monkeypatch.setattr(builder.systemd, "service_restart", (service_restart_mock := MagicMock()))
+    monkeypatch.setattr(builder.systemd, "service_reload", (service_reload_mock := MagicMock()))
 
     builder.configure_cron(
         unit_name=MagicMock(),
         interval=1,
     )
 
-    service_restart_mock.assert_not_called()
+    service_reload_mock.assert_not_called()
 
 
 @pytest.mark.parametrize(
     "expected_file_contents",
     [
         pytest.param(
-            """0 */1 * * * ubuntu /usr/bin/run-one /usr/bin/bash -c \
-/usr/bin/juju-exec "test-unit-name" "JUJU_DISPATCH_PATH=run HOME=/home/ubuntu ./dispatch"
+            """0 */1 * * * ubuntu /usr/bin/run-one /usr/bin/juju-exec "test-unit-name" \
+"JUJU_DISPATCH_PATH=run HOME=/home/ubuntu ./dispatch"
 """,
             id="runner version set",
         ),
@@ -369,14 +531,14 @@ def test_configure_cron(
     assert: subfunctions are called and cron file is written with expected contents.
     """
     monkeypatch.setattr(builder, "_should_configure_cron", MagicMock())
-    monkeypatch.setattr(builder.systemd, "service_restart", (service_restart_mock := MagicMock()))
+    monkeypatch.setattr(builder.systemd, "service_reload", (service_reload_mock := MagicMock()))
     test_path = tmp_path / "test"
     monkeypatch.setattr(builder, "CRON_BUILD_SCHEDULE_PATH", test_path)
     test_interval = 1
 
     builder.configure_cron(unit_name="test-unit-name", interval=test_interval)
 
-    service_restart_mock.assert_called_once()
+    service_reload_mock.assert_called_once()
     cron_contents = test_path.read_text(encoding="utf-8")
     assert cron_contents == expected_file_contents.format(TEST_PATH=test_path)
 
@@ -393,7 +555,17 @@ def test__should_configure_cron_no_path(monkeypatch: pytest.MonkeyPatch, tmp_pat
     assert builder._should_configure_cron(cron_contents=MagicMock())
 
 
-def test__should_configure_cron(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+@pytest.mark.parametrize(
+    "cron_contents, expected",
+    [
+        pytest.param(b"mismatching contents\n", True, id="different size"),
+        pytest.param(b"tset contents\n", True, id="same size, different contents"),
+        pytest.param(b"test contents\n", False, id="same contents"),
+    ],
+)
+def test__should_configure_cron(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, cron_contents: bytes, expected: bool
+):
     """
     arrange: given _should_configure_cron input values and monkeypatched CRON_BUILD_SCHEDULE_PATH.
     act: when _should_configure_cron is called.
@@ -403,20 +575,7 @@ def test__should_configure_cron(monkeypatch: pytest.MonkeyPatch, tmp_path: Path)
     test_path.write_text("test contents\n", encoding="utf-8")
     monkeypatch.setattr(builder, "CRON_BUILD_SCHEDULE_PATH", test_path)
 
-    assert builder._should_configure_cron(cron_contents="mismatching contents\n")
-
-
-def test_run_error(monkeypatch: pytest.MonkeyPatch):
-    """
-    arrange: given a monkeypatched pool.map that raises an error.
-    act: when run is called.
-    assert: BuilderRunError is raised.
-    """
-    monkeypatch.setattr(builder.multiprocessing, "Pool", pool_context_mock := MagicMock())
-    pool_context_mock.return_value.__enter__.return_value = (pool_mock := MagicMock())
-    pool_mock.map = MagicMock(side_effect=builder.multiprocessing.ProcessError("Process Error"))
-    with pytest.raises(builder.BuilderRunError):
-        builder.run(config_matrix=MagicMock(), static_config=MagicMock())
+    assert builder._should_configure_cron(cron_contents=cron_contents) == expected
 
 
 def _patched_test_func(*_args, **_kwargs):
@@ -441,7 +600,45 @@ def test_run(monkeypatch: pytest.MonkeyPatch):
     monkeypatch.setattr(builder, "_parametrize_build", MagicMock(return_value=["test", "test"]))
     monkeypatch.setattr(builder, "_run", _patched_test_func)
 
-    assert ["test", "test"] == builder.run(config_matrix=MagicMock(), static_config=MagicMock())
+    assert ("test", "test") == builder.run(config_matrix=MagicMock(), static_config=MagicMock())
+
+
+@pytest.mark.parametrize(
+    "func_name, parametrize_func_name",
+    [
+        pytest.param("run", "_parametrize_build", id="run"),
+        pytest.param("get_latest_images", "_parametrize_fetch", id="get latest images"),
+    ],
+)
+def test_no_configs(monkeypatch: pytest.MonkeyPatch, func_name: str, parametrize_func_name: str):
+    """
+    arrange: given a monkeypatched parametrize function that returns no configs.
+    act: when the builder function is called.
+    assert: an empty result is returned without creating a thread pool.
+    """
+    monkeypatch.setattr(builder, parametrize_func_name, MagicMock(return_value=()))
+    monkeypatch.setattr(
+        builder.concurrent.futures, "ThreadPoolExecutor", (executor_mock := MagicMock())
+    )
+
+    assert () == getattr(builder, func_name)(config_matrix=MagicMock(), static_config=MagicMock())
+    executor_mock.assert_not_called()
+
+
+def test_run_single_config(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: given a monkeypatched _parametrize_build that returns a single build config.
+    act: when run is called.
+    assert: the build is run without creating a thread pool.
+    """
+    monkeypatch.setattr(builder, "_parametrize_build", MagicMock(return_value=("test",)))
+    monkeypatch.setattr(builder, "_run", _patched_test_func)
+    monkeypatch.setattr(
+        builder.concurrent.futures, "ThreadPoolExecutor", (executor_mock := MagicMock())
+    )
+
+    assert ("test",) == builder.run(config_matrix=MagicMock(), static_config=MagicMock())
+    executor_mock.assert_not_called()
 
 
 # pylint doesn't quite understand walrus operators
@@ -687,7 +884,7 @@ def test__run_error(
     monkeypatch.setattr(builder.subprocess, "check_output", error)
 
     with pytest.raises(builder.BuilderRunError):
-        builder._run(config=MagicMock())
+        builder._run(config=factories.RunConfigFactory.create())
 
 
 @pytest.mark.parametrize(
@@ -696,7 +893,7 @@ def test__run_error(
         pytest.param(
             ("test-upload-cloud-a",),
             ("image-id-a",),
-            [
+            (
                 builder.CloudImage(
                     arch=TEST_RUN_CONFIG.image.arch,
                     base=TEST_RUN_CONFIG.image.base,
@@ -704,14 +901,14 @@ def test__run_error(
                     image_id="image-id-a",
                     juju=TEST_RUN_CONFIG.image.juju,
                     microk8s=TEST_RUN_CONFIG.image.microk8s,
-                )
-            ],
+                ),
+            ),
             id="single upload cloud",
         ),
         pytest.param(
             ("test-upload-cloud-a", "test-upload-cloud-b"),
             ("image-id-a", "image-id-b"),
-            [
+            (
                 builder.CloudImage(
                     arch=TEST_RUN_CONFIG.image.arch,
                     base=TEST_RUN_CONFIG.image.base,
@@ -728,7 +925,7 @@ def test__run_error(
                     juju=TEST_RUN_CONFIG.image.juju,
                     microk8s=TEST_RUN_CONFIG.image.microk8s,
                 ),
-            ],
+            ),
             id="multiple upload clouds",
         ),
     ],
@@ -737,7 +934,7 @@ def test__run(
     monkeypatch: pytest.MonkeyPatch,
     upload_clouds: typing.Iterable[str],
     output_image_ids: typing.Iterable[str],
-    expected_cloud_images: list[builder.CloudImage],
+    expected_cloud_images: tuple[builder.CloudImage, ...],
 ):
     """
     arrange: given a monkeypatched subprocess call.
@@ -751,20 +948,42 @@ def test__run(
         MagicMock(return_value=f"Image build success:\n{','.join(output_image_ids)}"),
     )
     test_run_config: builder.RunConfig = factories.RunConfigFactory.create()
-    test_run_config.cloud.upload_clouds = upload_clouds
+    test_run_config = dataclasses.replace(
+        test_run_config,
+        cloud=dataclasses.replace(test_run_config.cloud, upload_clouds=upload_clouds),
+    )
 
     assert builder._run(config=test_run_config) == expected_cloud_images
 
 
+def test__run_info_log_disabled(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: given a monkeypatched subprocess call and INFO logging disabled.
+    act: when _run is called.
+    assert: the build command is not rendered for logging.
+    """
+    monkeypatch.setattr(
+        builder.subprocess,
+        "check_output",
+        MagicMock(return_value="Image build success:\nimage-id-a"),
+    )
+    monkeypatch.setattr(builder.logger, "isEnabledFor", MagicMock(return_value=False))
+    monkeypatch.setattr(builder.shlex, "join", (join_mock := MagicMock()))
+
+    builder._run(config=factories.RunConfigFactory.create())
+
+    join_mock.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "run_args, cloud_options, image_options, service_options, expected_command",
     [
         pytest.param(
             builder._RunArgs(cloud_name="test-build-cloud", image_name="test-output-image-name"),
-            builder._CloudOptions(
+            run_options.CloudOptions(
                 flavor=None, keep_revisions=None, network=None, prefix=None, upload_clouds=None
             ),
-            builder._ImageOptions(
+            run_options.ImageOptions(
                 arch=None,
                 image_base=None,
                 juju=None,
@@ -773,7 +992,7 @@ def test__run(
                 script_url=None,
                 script_secrets=None,
             ),
-            builder._ServiceOptions(dockerhub_cache=None, proxy=None),
+            run_options.ServiceOptions(dockerhub_cache=None, proxy=None),
             [
                 "/usr/bin/run-one",
                 "/usr/bin/sudo",
@@ -789,14 +1008,14 @@ def test__run(
         ),
         pytest.param(
             builder._RunArgs(cloud_name="test-build-cloud", image_name="test-output-image-name"),
-            builder._CloudOptions(
+            run_options.CloudOptions(
                 flavor="test-flavor",
                 keep_revisions=5,
                 network="test-network",
                 prefix="test-prefix-",
                 upload_clouds=("test-upload-cloud-a", "test-upload-cloud-b"),
             ),
-            builder._ImageOptions(
+            run_options.ImageOptions(
                 arch=None,
                 image_base=None,
                 juju=None,
@@ -805,7 +1024,7 @@ def test__run(
                 script_url=None,
                 script_secrets=None,
             ),
-            builder._ServiceOptions(dockerhub_cache=None, proxy=None),
+            run_options.ServiceOptions(dockerhub_cache=None, proxy=None),
             [
                 "/usr/bin/run-one",
                 "/usr/bin/sudo",
@@ -831,10 +1050,10 @@ def test__run(
         ),
         pytest.param(
             builder._RunArgs(cloud_name="test-build-cloud", image_name="test-output-image-name"),
-            builder._CloudOptions(
+            run_options.CloudOptions(
                 flavor=None, keep_revisions=None, network=None, prefix=None, upload_clouds=None
             ),
-            builder._ImageOptions(
+            run_options.ImageOptions(
                 arch=state.Arch.ARM64,
                 image_base=state.BaseImage.JAMMY,
                 juju="3.1/stable",
@@ -843,7 +1062,7 @@ def test__run(
                 script_url="https://test-script-url.com/script.sh",
                 script_secrets=None,
             ),
-            builder._ServiceOptions(dockerhub_cache=None, proxy=None),
+            run_options.ServiceOptions(dockerhub_cache=None, proxy=None),
             [
                 "/usr/bin/run-one",
                 "/usr/bin/sudo",
@@ -871,10 +1090,10 @@ def test__run(
         ),
         pytest.param(
             builder._RunArgs(cloud_name="test-build-cloud", image_name="test-output-image-name"),
-            builder._CloudOptions(
+            run_options.CloudOptions(
                 flavor=None, keep_revisions=None, network=None, prefix=None, upload_clouds=None
             ),
-            builder._ImageOptions(
+            run_options.ImageOptions(
                 arch=None,
                 image_base=None,
                 juju=None,
@@ -883,7 +1102,7 @@ def test__run(
                 script_url=None,
                 script_secrets=None,
             ),
-            builder._ServiceOptions(
+            run_options.ServiceOptions(
                 dockerhub_cache="https://dockerhub-cache.com:5000",
                 proxy="https://test-proxy.com:3128",
             ),
@@ -908,9 +1127,9 @@ def test__run(
 )
 def test__build_run_command(
     run_args: builder._RunArgs,
-    cloud_options: builder._CloudOptions,
-    image_options: builder._ImageOptions,
-    service_options: builder._ServiceOptions,
+    cloud_options: run_options.CloudOptions,
+    image_options: run_options.ImageOptions,
+    service_options: run_options.ServiceOptions,
     expected_command: list[str],
 ):
     """
@@ -1147,31 +1366,55 @@ def test__parametrize_fetch(
     )
 
 
-def test_get_latest_images_error(monkeypatch: pytest.MonkeyPatch):
+def test_get_latest_images(monkeypatch: pytest.MonkeyPatch):
     """
-    arrange: given a monkeypatched pool.map that raises an error.
+    arrange: given a monkeypatched _run function.
     act: when get_latest_images is called.
-    assert: GetLatestImageError is raised.
+    assert: get_latest_images results are returned.
     """
-    monkeypatch.setattr(builder.multiprocessing, "Pool", pool_context_mock := MagicMock())
-    pool_context_mock.return_value.__enter__.return_value = (pool_mock := MagicMock())
-    pool_mock.map = MagicMock(side_effect=builder.multiprocessing.ProcessError("Process Error"))
-    with pytest.raises(builder.GetLatestImageError):
-        builder.get_latest_images(config_matrix=MagicMock(), static_config=MagicMock())
+    monkeypatch.setattr(builder, "_parametrize_fetch", MagicMock(return_value=["test", "test"]))
+    monkeypatch.setattr(builder, "_get_latest_image", _patched_test_func)
+
+    assert ("test", "test") == builder.get_latest_images(
+        config_matrix=MagicMock(), static_config=MagicMock()
+    )
 
 
-def test_get_latest_images(monkeypatch: pytest.MonkeyPatch):
+def test_get_latest_images_single_config(monkeypatch: pytest.MonkeyPatch):
     """
-    arrange: given a monkeypatched _run function.
+    arrange: given a monkeypatched _parametrize_fetch that returns a single unique fetch config.
     act: when get_latest_images is called.
-    assert: get_latest_images results are returned.
+    assert: the latest image is fetched once without creating a thread pool.
     """
-    monkeypatch.setattr(builder, "_parametrize_fetch", MagicMock(return_value=["test", "test"]))
+    monkeypatch.setattr(builder, "_parametrize_fetch", MagicMock(return_value=("test", "test")))
     monkeypatch.setattr(builder, "_get_latest_image", _patched_test_func)
+    monkeypatch.setattr(
+        builder.concurrent.futures, "ThreadPoolExecutor", (executor_mock := MagicMock())
+    )
+
+    assert ("test", "test") == builder.get_latest_images(
+        config_matrix=MagicMock(), static_config=MagicMock()
+    )
+    executor_mock.assert_not_called()
+
+
+def test_get_latest_images_duplicate_configs(monkeypatch: pytest.MonkeyPatch):
+    """
+    arrange: given a monkeypatched _parametrize_fetch that returns duplicate fetch configs.
+    act: when get_latest_images is called.
+    assert: the latest image is fetched once per unique config and returned per config.
+    """
+    monkeypatch.setattr(
+        builder, "_parametrize_fetch", MagicMock(return_value=("test-a", "test-b", "test-a"))
+    )
+    monkeypatch.setattr(
+        builder, "_get_latest_image", (get_latest_image_mock := MagicMock(side_effect=str.upper))
+    )
 
-    assert ["test", "test"] == builder.get_latest_images(
+    assert ("TEST-A", "TEST-B", "TEST-A") == builder.get_latest_images(
         config_matrix=MagicMock(), static_config=MagicMock()
     )
+    assert get_latest_image_mock.call_count == 2
 
 
 @pytest.mark.parametrize(
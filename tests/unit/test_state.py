@@ -262,11 +262,11 @@ def test__parse_dockerhub_cache_config(dockerhub_cache_url: str, expected_url: s
 
 def test__get_num_parallel_build_error(monkeypatch: pytest.MonkeyPatch):
     """
-    arrange: given monkeypatched multiprocessing.cpu_count() function that returns 1 core.
+    arrange: given monkeypatched os.sched_getaffinity() function that returns 1 core.
     act: when _get_num_parallel_build is called.
     assert: InsufficientCoresError is raised.
     """
-    monkeypatch.setattr(state.multiprocessing, "cpu_count", MagicMock(return_value=1))
+    monkeypatch.setattr(state.os, "sched_getaffinity", MagicMock(return_value={0}))
 
     with pytest.raises(state.InsufficientCoresError):
         state._get_num_parallel_build(charm=MagicMock())